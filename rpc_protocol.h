@@ -19,6 +19,9 @@ Request JSON Format:
 }
 - "args" is a JSON array containing arguments. Arguments can be JSON numbers
   (int or float), strings, booleans, or null.
+- An integer array argument may instead be sent as
+  {"__bin_i64__": "<base64 of little-endian int64 values>"}; the server
+  expands it back into a JSON array before dispatch.
 */
 
 /*
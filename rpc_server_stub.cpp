@@ -2,6 +2,7 @@
 #include <jsoncpp/json/json.h>  // For JSON parsing/serialization
 #include <sys/socket.h> // For socket, bind, listen, accept
 #include <netinet/in.h> // For sockaddr_in, INADDR_ANY, htonl, htons
+#include <netinet/tcp.h> // For TCP_NODELAY
 #include <arpa/inet.h>  // For htonl, ntohl (needed for length prefix)
 #include <unistd.h>     // For close
 #include <stdexcept>
@@ -15,6 +16,78 @@ namespace rpc_server {
 using namespace rpc_protocol;
 using namespace rpc_connection;
 
+namespace {
+
+// Clients may send integer arrays in a compact form instead of a JSON array:
+// {"__bin_i64__": "<base64 of little-endian int64 values>"}
+const char* const BINARY_INT64_KEY = "__bin_i64__";
+
+std::vector<uint8_t> base64_decode(const std::string& input) {
+    static const std::string alphabet =
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/";
+    std::vector<uint8_t> output;
+    output.reserve(input.size() / 4 * 3);
+    uint32_t buffer = 0;
+    int bits = 0;
+    for (char c : input) {
+        if (c == '=') break;
+        size_t value = alphabet.find(c);
+        if (value == std::string::npos) {
+            throw std::invalid_argument("Invalid base64 data");
+        }
+        buffer = (buffer << 6) | static_cast<uint32_t>(value);
+        bits += 6;
+        if (bits >= 8) {
+            bits -= 8;
+            output.push_back(static_cast<uint8_t>((buffer >> bits) & 0xFF));
+        }
+    }
+    return output;
+}
+
+// Replaces binary-encoded integer arrays in the argument list with regular
+// JSON arrays, so registered functions only ever see plain JSON values.
+void expand_binary_arrays(Json::Value& args) {
+    if (!args.isArray()) return;
+    for (Json::Value& arg : args) {
+        if (!arg.isObject() || arg.size() != 1 || !arg.isMember(BINARY_INT64_KEY) ||
+            !arg[BINARY_INT64_KEY].isString()) {
+            continue;
+        }
+        std::vector<uint8_t> bytes = base64_decode(arg[BINARY_INT64_KEY].asString());
+        if (bytes.size() % 8 != 0) {
+            throw std::invalid_argument("Binary int64 array has a partial element");
+        }
+        Json::Value values(Json::arrayValue);
+        for (size_t i = 0; i < bytes.size(); i += 8) {
+            uint64_t value = 0;
+            for (int b = 7; b >= 0; --b) {
+                value = (value << 8) | bytes[i + b];
+            }
+            values.append(Json::Value(static_cast<Json::Int64>(value)));
+        }
+        arg = values;
+    }
+}
+
+// Serializes a response without indentation and adds its length prefix.
+// jsoncpp's default writer indents its output, which only adds bytes to
+// every response, e.g. {"result":3,"status":"success"} becomes 40 bytes
+// instead of 31.
+std::vector<uint8_t> serialize_response(const Json::Value& response) {
+    Json::StreamWriterBuilder writer;
+    writer["indentation"] = "";
+    std::string body = Json::writeString(writer, response);
+
+    uint32_t length = htonl(static_cast<uint32_t>(body.size()));
+    std::vector<uint8_t> framed(sizeof(length) + body.size());
+    std::memcpy(framed.data(), &length, sizeof(length));
+    std::memcpy(framed.data() + sizeof(length), body.data(), body.size());
+    return framed;
+}
+
+} // namespace
+
 // --- Constructor / Destructor ---
 
 RPCServer::RPCServer(int port) : port(port), listen_fd(-1), running(false) {
@@ -79,6 +152,12 @@ void RPCServer::start() {
             std::cerr << "Accept error: " << strerror(errno) << std::endl;
             continue;
         }
+        // Disable Nagle: with pipelined requests, each small response would
+        // otherwise wait for the client's delayed ACK of the previous one
+        int nodelay = 1;
+        if (setsockopt(client_fd, IPPROTO_TCP, TCP_NODELAY, &nodelay, sizeof(nodelay)) < 0) {
+            std::cerr << "setsockopt(TCP_NODELAY) failed: " << strerror(errno) << std::endl;
+        }
         std::thread([this, client_fd]() {
             auto conn = std::make_unique<Connection>(client_fd);
             try {
@@ -212,6 +291,7 @@ std::vector<uint8_t> RPCServer::process_json_request(const std::string& request_
     Json::Value args = root["args"];
     
     try {
+        expand_binary_arrays(args);
         if (!function_registry.count(func_name)) {
             throw FunctionNotFoundError("Function not found");
         }
@@ -1,4 +1,7 @@
 # client_app/benchmark.py
+import asyncio
+import socket
+import struct
 import time
 import statistics
 import sys
@@ -12,7 +15,7 @@ script_dir = os.path.dirname(
 rpc_lib_path = os.path.abspath(os.path.join(script_dir, "..", "rpc_lib", "python"))
 sys.path.insert(0, rpc_lib_path)
 
-from rpc_client_stub import RPCClient
+from rpc_client_stub import AsyncRPCClient, RPCClient
 from rpc_exceptions import (
     RPCError,
     ConnectionError,
@@ -204,6 +207,133 @@ def test_complex_data(host, port):
             print(f"❌ Complex return test failed: {e}")
 
 
+def test_pipeline(host, port):
+    """Test batched calls, including an error in the middle of a batch."""
+    print("\n=== Pipeline Test ===")
+    with RPCClient(host, port) as client:
+        try:
+            results = client.call_pipeline(
+                [("add", [1, 2]), ("greet", ["World"]), ("no_return", [])]
+            )
+            assert results == [3, "Hello, World!", None], f"Got {results}"
+            print(f"✓ Pipelined calls work: {results}")
+        except Exception as e:
+            print(f"❌ Pipeline test failed: {e}")
+
+        # The responses after the failing call must still be read, or the
+        # next call would receive one of them
+        try:
+            client.call_pipeline(
+                [("add", [1, 2]), ("non_existent_function", []), ("add", [3, 4])]
+            )
+            print("❌ Failed to raise the error from the middle of the batch")
+        except FunctionNotFoundError:
+            print("✓ Correctly raised FunctionNotFoundError from the batch")
+        except Exception as e:
+            print(f"❌ Wrong exception type: {type(e).__name__}")
+
+        try:
+            result = client.call("add", 5, 6)
+            assert result == 11, f"add(5, 6) returned {result}, expected 11"
+            print("✓ Connection stays in sync after a failed batch")
+        except Exception as e:
+            print(f"❌ Call after failed batch failed: {e}")
+
+
+def test_bind(host, port):
+    """Test bound call stubs."""
+    print("\n=== Bind Test ===")
+    with RPCClient(host, port) as client:
+        try:
+            add = client.bind("add")
+            no_return = client.bind("no_return")
+            is_positive = client.bind("is_positive")
+            assert add(42, 58) == 100, "Bound add(42, 58) did not return 100"
+            assert no_return() is None, "Bound no_return() did not return None"
+            assert is_positive(-5) is False, "Bound is_positive(-5) was not False"
+            print("✓ Bound calls work")
+        except Exception as e:
+            print(f"❌ Bind test failed: {e}")
+
+        try:
+            client.bind("non_existent_function")()
+            print("❌ Failed to catch non-existent bound function")
+        except FunctionNotFoundError:
+            print("✓ Correctly caught FunctionNotFoundError from bound call")
+        except Exception as e:
+            print(f"❌ Wrong exception type: {type(e).__name__}")
+
+
+def test_binary_arrays(host, port):
+    """Test integer arrays sent in the binary int64 form."""
+    print("\n=== Binary Arrays Test ===")
+    with RPCClient(host, port, binary_arrays=True) as client:
+        try:
+            numbers = [1, -2, 3, 100000, 0]
+            result = client.call("sum_array", numbers)
+            assert result == 100002, f"Expected 100002, got {result}"
+            print(f"✓ Binary arrays work: sum_array({numbers}) = {result}")
+            result = client.call("sum_array", [])
+            assert result == 0, f"Expected 0 for an empty array, got {result}"
+            print("✓ Empty binary array works")
+        except Exception as e:
+            print(f"❌ Binary arrays test failed: {e}")
+
+        try:
+            result = client.call("get_greetings", ["Alice", "Bob"])
+            assert len(result) == 2, f"Expected 2 items, got {len(result)}"
+            print("✓ Non-integer lists are sent as plain JSON")
+        except Exception as e:
+            print(f"❌ Non-integer list test failed: {e}")
+
+
+def test_async_client(host, port):
+    """Test concurrent calls on one AsyncRPCClient."""
+    print("\n=== Async Client Test ===")
+
+    async def run():
+        async with AsyncRPCClient(host, port) as client:
+            results = await asyncio.gather(
+                *(client.call("add", i, i) for i in range(20))
+            )
+            assert results == [2 * i for i in range(20)], f"Got {results}"
+            print("✓ Concurrent async calls work")
+
+            results = await asyncio.gather(
+                client.call("add", 1, 2),
+                client.call("non_existent_function"),
+                client.call("add", 3, 4),
+                return_exceptions=True,
+            )
+            assert results[0] == 3 and results[2] == 7, f"Got {results}"
+            assert isinstance(results[1], FunctionNotFoundError), f"Got {results[1]!r}"
+            print("✓ Async errors only fail their own call")
+
+    try:
+        asyncio.run(run())
+    except Exception as e:
+        print(f"❌ Async client test failed: {e}")
+
+
+def test_response_format(host, port):
+    """Test that success responses are serialized without whitespace."""
+    print("\n=== Response Format Test ===")
+    with socket.create_connection((host, port)) as sock:
+        request = b'{"function":"add","args":[1,2]}'
+        sock.sendall(struct.pack("!I", len(request)) + request)
+        reader = sock.makefile("rb")
+        (length,) = struct.unpack("!I", reader.read(4))
+        response = reader.read(length)
+        reader.close()
+    try:
+        assert (
+            response == b'{"result":3,"status":"success"}'
+        ), f"Unexpected success response {response!r}"
+        print(f"✓ Success responses are compact: {response.decode()}")
+    except AssertionError as e:
+        print(f"❌ Response format test failed: {e}")
+
+
 def main():
     if len(sys.argv) != 3:
         print("Usage: python main.py <host> <port>")
@@ -228,6 +358,11 @@ def main():
         test_error_handling(host, port)
         test_reconnection(host, port)
         test_complex_data(host, port)
+        test_pipeline(host, port)
+        test_bind(host, port)
+        test_binary_arrays(host, port)
+        test_async_client(host, port)
+        test_response_format(host, port)
 
         print("\n✅ All benchmark tests completed!")
     except ConnectionError as e: